@@ -3,6 +3,7 @@ REAL Emotion Detector (TFLite)
 Runs the custom ResNet model on raw audio waveforms.
 """
 import os
+import threading
 import time
 import wave
 import numpy as np
@@ -51,11 +52,19 @@ class EmotionDetector:
     
     INTENSITY_LEVELS = ['low', 'medium', 'high']
     
+    # Model input: 3 seconds of 16 kHz mono audio
+    SAMPLE_RATE = 16000
+    INPUT_LEN = 48000
+    
     def __init__(self, model_filename="voice_model.tflite"):
         """Initialize the TFLite interpreter"""
         self.interpreter = None
         self.input_details = None
         self.output_details = None
+        # The interpreter is not thread-safe; warm-up and analysis run on worker threads
+        self._invoke_lock = threading.Lock()
+        # Reused model input; filled in place on every analysis (guarded by the lock)
+        self._input_buffer = np.zeros((1, self.INPUT_LEN, 1), dtype=np.float32)
         
         # Look for model in assets or current dir
         paths_to_check = [
@@ -68,7 +77,13 @@ class EmotionDetector:
         
         if model_path and tflite:
             try:
-                self.interpreter = tflite.Interpreter(model_path=str(model_path))
+                # XNNPACK is the default CPU delegate in LiteRT/TFLite; num_threads
+                # sizes its threadpool (it runs single-threaded otherwise). Capped at
+                # 4 so big.LITTLE phones don't wait on efficiency cores or starve the UI
+                self.interpreter = tflite.Interpreter(
+                    model_path=str(model_path),
+                    num_threads=min(4, os.cpu_count() or 1)
+                )
                 self.interpreter.allocate_tensors()
                 self.input_details = self.interpreter.get_input_details()
                 self.output_details = self.interpreter.get_output_details()
@@ -91,27 +106,41 @@ class EmotionDetector:
 
         try:
             # --- 1. LOAD RAW AUDIO ---
+            # Minimal reader for the recorder's 16-bit PCM WAVs (no decoder libraries)
             with wave.open(str(audio_file_path), 'rb') as wf:
+                if wf.getsampwidth() != 2:
+                    raise ValueError(f"expected 16-bit PCM, got {wf.getsampwidth() * 8}-bit")
+                sample_rate = wf.getframerate()
+                channels = wf.getnchannels()
                 frames = wf.readframes(wf.getnframes())
-                audio_int16 = np.frombuffer(frames, dtype=np.int16)
-                audio_float = audio_int16.astype(np.float32) / 32768.0
+                audio_int16 = np.frombuffer(frames, dtype='<i2')
+                if channels > 1:
+                    # Keep the first channel as a strided view instead of averaging
+                    audio_int16 = audio_int16[::channels]
+                # Convert + scale in one ufunc call (a single float32 allocation)
+                audio_float = np.multiply(audio_int16, np.float32(1.0 / 32768.0), dtype=np.float32)
+
+            # Resample only when the recorder didn't honor 16 kHz (older recordings,
+            # platforms that ignore sample_rate); linear interpolation, numpy only
+            if sample_rate != self.SAMPLE_RATE:
+                positions = np.arange(0, len(audio_float), sample_rate / self.SAMPLE_RATE)
+                audio_float = np.interp(positions, np.arange(len(audio_float)), audio_float).astype(np.float32)
 
             # --- 2. THE NOISE GATE (Background Talker Killer) ---
             # Calculate the Peak volume of the Main Speaker (You)
-            max_amp = np.max(np.abs(audio_float))
+            # abs() is taken once and reused for the gate mask below
+            abs_audio = np.abs(audio_float)
+            max_amp = abs_audio.max()
             
             # Threshold: Keep only sounds that are at least 30% as loud as the peak.
             # Background talking is usually 10-20% volume. You are 80-100%.
             gate_threshold = max_amp * 0.30 
             
-            # Apply the gate: Everything below threshold becomes 0.0 (Silence)
+            # Apply the gate in place: Everything below threshold becomes 0.0 (Silence)
             # We use a mask to avoid "choppy" artifacts
-            mask = np.abs(audio_float) > gate_threshold
-            audio_gated = audio_float * mask
+            audio_float[abs_audio <= gate_threshold] = 0.0
             
-            # Update metrics based on the NEW gated audio
-            audio_float = audio_gated
-            max_amp = np.max(np.abs(audio_float))
+            # The peak sample always survives the gate, so max_amp still holds
             print(f"🎤 Main Speaker Amp: {max_amp:.4f} (Background Silenced)")
 
             # --- 3. SILENCE CHECK ---
@@ -120,20 +149,22 @@ class EmotionDetector:
                 return self._build_result('neutral', 0.9, 'low')
 
             # --- 4. PREPARE FOR AI ---
-            # Pad/Trim to 48000
-            target_len = 48000
-            if len(audio_float) > target_len:
-                audio_float = audio_float[:target_len]
-            else:
-                padding = target_len - len(audio_float)
-                audio_float = np.pad(audio_float, (0, padding), 'constant')
-
-            input_tensor = audio_float.reshape(1, target_len, 1)
+            # Pad/Trim to INPUT_LEN by copying into the reused buffer
+            # (no np.pad / reshape temporaries). Long clips keep their first
+            # 3 seconds on purpose, not a center crop; that is the app's behavior
+            n = min(len(audio_float), self.INPUT_LEN)
 
             # --- 2. INFERENCE ---
-            self.interpreter.set_tensor(self.input_details[0]['index'], input_tensor)
-            self.interpreter.invoke()
-            output_data = self.interpreter.get_tensor(self.output_details[0]['index'])[0]
+            with self._invoke_lock:
+                window = self._input_buffer[0, :, 0]
+                window[:n] = audio_float[:n]
+                window[n:] = 0.0
+                input_tensor = self._quantize_input(self._input_buffer)
+                self.interpreter.set_tensor(self.input_details[0]['index'], input_tensor)
+                self.interpreter.invoke()
+                output_data = self._dequantize_output(
+                    self.interpreter.get_tensor(self.output_details[0]['index'])[0]
+                )
 
             # --- 3. DECODE RESULTS ---
             max_index = np.argmax(output_data)
@@ -149,10 +180,12 @@ class EmotionDetector:
             meta = self.EMOTIONS.get(emotion_key, self.EMOTIONS['neutral'])
             
             # --- DEBUG PRINTS ---
-            print(f"Max Amplitude: {np.max(np.abs(audio_float)):.4f}") 
-            print("Raw Confidences:")
-            for i, score in enumerate(output_data):
-                print(f"   {self.MODEL_CLASSES[i]}: {score:.4f}")
+            # Built as one string so the report is a single write to stdout
+            confidences = "\n".join(
+                f"   {label}: {score:.4f}"
+                for label, score in zip(self.MODEL_CLASSES, output_data)
+            )
+            print(f"Max Amplitude: {np.max(np.abs(audio_float[:n])):.4f}\nRaw Confidences:\n{confidences}")
             # -------------------------------
 
             return {
@@ -169,6 +202,24 @@ class EmotionDetector:
             print(f" Analysis Error: {e}")
             return self._get_fallback_result()
 
+    def warm_up(self):
+        """
+        Runs one inference on silence so kernel/delegate setup happens now,
+        not on the user's first vibe check. Safe to call from a background thread.
+        """
+        if self.interpreter is None:
+            return
+
+        try:
+            shape = self.input_details[0]['shape']
+            silence = np.zeros(shape, dtype=self.input_details[0]['dtype'])
+            with self._invoke_lock:
+                self.interpreter.set_tensor(self.input_details[0]['index'], silence)
+                self.interpreter.invoke()
+            print(" Model warmed up")
+        except Exception as e:
+            print(f" Warm-up Error: {e}")
+
     def get_emotion_info(self, emotion_name):
         """Metadata lookup for UI"""
         return self.EMOTIONS.get(emotion_name.lower(), self.EMOTIONS['neutral'])
@@ -189,6 +240,26 @@ class EmotionDetector:
             'confidence': float(confidence)
         }
 
+    def _quantize_input(self, tensor):
+        """Maps float audio onto an int8/uint8 model input (no-op for float models)"""
+        detail = self.input_details[0]
+        if not np.issubdtype(detail['dtype'], np.integer):
+            return tensor
+
+        scale, zero_point = detail['quantization']
+        info = np.iinfo(detail['dtype'])
+        quantized = np.round(tensor / scale + zero_point)
+        return np.clip(quantized, info.min, info.max).astype(detail['dtype'])
+
+    def _dequantize_output(self, scores):
+        """Turns int8/uint8 model scores back into float probabilities"""
+        detail = self.output_details[0]
+        if not np.issubdtype(detail['dtype'], np.integer):
+            return scores
+
+        scale, zero_point = detail['quantization']
+        return (scores.astype(np.float32) - zero_point) * scale
+
     def _get_fallback_result(self):
         """Returns neutral if things break, prevents app crash"""
         return {
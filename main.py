@@ -7,6 +7,7 @@ import flet_audio_recorder as far
 from voice_recorder import VoiceRecorder
 from emotion_detector import EmotionDetector
 from analytics import EmotionAnalytics
+import os
 import threading
 import time
 from datetime import datetime
@@ -17,6 +18,12 @@ class VoiceRecorderApp:
         self.recorder_manager = VoiceRecorder()
         self.emotion_detector = EmotionDetector()
         
+        # Pay the first-inference setup cost now, off the UI thread
+        threading.Thread(target=self.emotion_detector.warm_up, daemon=True).start()
+        
+        # Resolved once so start_recording does no path work on the UI thread
+        self._temp_path_prefix = os.path.join(str(self.recorder_manager.recordings_dir), "temp_")
+        
         self.is_recording = False
         self.timer_running = False
         
@@ -24,8 +31,12 @@ class VoiceRecorderApp:
         self.processing_files = set()
         
         # --- AUDIO RECORDER ---
+        # Record in the model's native format (16 kHz mono PCM) so the detector
+        # normally skips its resample fallback (some platforms ignore this)
         self.audio_recorder = far.AudioRecorder(
             audio_encoder=far.AudioEncoder.WAV,
+            sample_rate=16000,
+            channels_num=1,
             on_state_changed=self.handle_recorder_state
         )
         self.page.overlay.append(self.audio_recorder)
@@ -39,6 +50,7 @@ class VoiceRecorderApp:
         self.recording_indicator = None
         self.recordings_list = None
         self.content_container = None
+        self.audio_player = None
         
         self.setup_page()
         self.build_ui()
@@ -251,9 +263,7 @@ class VoiceRecorderApp:
 
     # --- LOGIC ---
     def start_recording(self, e):
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        temp_filename = f"temp_{timestamp}.wav"
-        save_path = str(self.recorder_manager.recordings_dir / temp_filename)
+        save_path = f"{self._temp_path_prefix}{int(time.time() * 1000)}.wav"
 
         if self.page.web: self.audio_recorder.start_recording()
         else: self.audio_recorder.start_recording(output_path=save_path)
@@ -396,9 +406,18 @@ class VoiceRecorderApp:
             )
 
     def play_audio(self, path):
-        audio = ft.Audio(src=path, autoplay=True)
-        self.page.overlay.append(audio)
-        self.page.update()
+        # One player for the whole session; a new Audio per tap kept every
+        # previously played clip loaded in the overlay
+        if self.audio_player is None:
+            self.audio_player = ft.Audio(src=path, autoplay=True)
+            self.page.overlay.append(self.audio_player)
+            self.page.update()
+        elif self.audio_player.src != path:
+            self.audio_player.src = path
+            self.audio_player.update()
+        else:
+            self.audio_player.seek(0)
+            self.audio_player.resume()
 
     def delete_rec(self, path):
         self.recorder_manager.delete_recording(path)
@@ -14,6 +14,8 @@ class VoiceRecorder:
     def __init__(self):
         self.recordings_dir = Path("recordings")
         self.recordings_dir.mkdir(exist_ok=True)
+        # path -> ((wav mtime, wav size, sidecar mtime, sidecar size), recording dict)
+        self._recordings_cache = {}
         
     def save_recording(self, temp_path):
         """
@@ -52,23 +54,51 @@ class VoiceRecorder:
         if not self.recordings_dir.exists():
             return []
 
-        # Filter out temp files so they don't show up in the list
-        for file in self.recordings_dir.glob("recording_*.wav"):
-            emotion_data = self.load_emotion_metadata(str(file))
+        # Single scandir pass lists both the WAVs and their JSON sidecars
+        files = []
+        sidecars = {}
+        with os.scandir(self.recordings_dir) as entries:
+            for entry in entries:
+                # Filter out temp files so they don't show up in the list
+                if not entry.name.startswith("recording_"):
+                    continue
+                if entry.name.endswith(".wav"):
+                    files.append(entry)
+                elif entry.name.endswith(".json"):
+                    sidecars[entry.name[:-len(".json")]] = entry
+
+        # Rows are rebuilt (and the sidecar re-parsed) only when the WAV or
+        # its sidecar changed since the last call
+        cache = {}
+        for file in files:
             try:
                 stat = file.stat()
-                recordings.append({
-                    'filename': file.name,
-                    'path': str(file),
-                    'timestamp': datetime.fromtimestamp(stat.st_mtime),
-                    'size': stat.st_size,
-                    'emotion': emotion_data.get('emotion'),
-                    'emotion_emoji': emotion_data.get('emoji'),
-                    'emotion_color': emotion_data.get('color'),
-                    'emotion_confidence': emotion_data.get('confidence', 0), # Added for percentage
-                })
+                sidecar = sidecars.get(file.name[:-len(".wav")])
+                sidecar_stat = sidecar.stat() if sidecar else None
+                key = (
+                    stat.st_mtime_ns, stat.st_size,
+                    sidecar_stat.st_mtime_ns if sidecar_stat else None,
+                    sidecar_stat.st_size if sidecar_stat else None,
+                )
+
+                cached = self._recordings_cache.get(file.path)
+                if cached is None or cached[0] != key:
+                    emotion_data = self.load_emotion_metadata(file.path) if sidecar else {}
+                    cached = (key, {
+                        'filename': file.name,
+                        'path': file.path,
+                        'timestamp': datetime.fromtimestamp(stat.st_mtime),
+                        'size': stat.st_size,
+                        'emotion': emotion_data.get('emotion'),
+                        'emotion_emoji': emotion_data.get('emoji'),
+                        'emotion_color': emotion_data.get('color'),
+                        'emotion_confidence': emotion_data.get('confidence', 0), # Added for percentage
+                    })
+                cache[file.path] = cached
+                recordings.append(dict(cached[1]))
             except Exception as e:
-                print(f"Skipping file {file}: {e}")
+                print(f"Skipping file {file.path}: {e}")
+        self._recordings_cache = cache
                 
         # Sort by timestamp, newest first
         recordings.sort(key=lambda x: x['timestamp'], reverse=True)
@@ -83,19 +113,29 @@ class VoiceRecorder:
             emotion_file = path_obj.with_suffix('.json')
             if emotion_file.exists():
                 emotion_file.unlink()
+            
+            # Leftover from an interrupted save_emotion_metadata
+            path_obj.with_suffix('.json.tmp').unlink(missing_ok=True)
             return True
         except Exception as e:
             print(f"Error deleting recording: {e}")
             return False
     
     def save_emotion_metadata(self, audio_filepath, emotion_data):
+        tmp_file = None
         try:
             emotion_file = Path(audio_filepath).with_suffix('.json')
-            with open(emotion_file, 'w') as f:
+            # Write to a temp file and swap it in, so get_recordings never
+            # sees a truncated or half-written sidecar
+            tmp_file = emotion_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w') as f:
                 json.dump(emotion_data, f, indent=2)
+            os.replace(tmp_file, emotion_file)
             return True
         except Exception as e:
             print(f"Error saving emotion metadata: {e}")
+            if tmp_file is not None:
+                tmp_file.unlink(missing_ok=True)
             return False
     
     def load_emotion_metadata(self, audio_filepath):